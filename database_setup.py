@@ -4,6 +4,10 @@ from datetime import datetime
 conn = sqlite3.connect("event_planning.db")
 cursor = conn.cursor()
 
+# WAL mode is persistent in the database file, so setting it once here is enough
+cursor.execute("PRAGMA journal_mode=WAL")
+cursor.execute("PRAGMA synchronous=NORMAL")
+
 cursor.execute("""
 CREATE TABLE IF NOT EXISTS moderators (
     id INTEGER PRIMARY KEY,
@@ -29,6 +33,11 @@ CREATE TABLE IF NOT EXISTS participants (
 )
 """)
 
+cursor.execute("""
+CREATE INDEX IF NOT EXISTS idx_participants_created_at
+ON participants(created_at DESC)
+""")
+
 conn.commit()
 conn.close()
 
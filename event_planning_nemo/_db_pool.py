@@ -0,0 +1,139 @@
+"""
+Shared SQLite connections for event planning tools
+
+Each database path gets one writer connection, serialized by an asyncio lock,
+and a small queue of read-only connections. Connections stay open for the
+life of the process instead of being reopened on every tool call. Blocking
+SQLite calls run on a thread pool sized to match, via run_db().
+"""
+
+import asyncio
+import functools
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+READER_POOL_SIZE = 4
+DEFAULT_MMAP_SIZE = 268435456  # 256 MB of memory-mapped I/O
+DEFAULT_CACHE_SIZE = -65536  # negative means KiB, i.e. a 64 MB page cache
+# Parsed statements kept per connection, keyed by SQL text
+STATEMENT_CACHE_SIZE = 128
+
+_writers: Dict[str, sqlite3.Connection] = {}
+_writer_locks: Dict[str, asyncio.Lock] = {}
+_readers: Dict[str, "asyncio.Queue[sqlite3.Connection]"] = {}
+
+# One thread for the writer plus one per reader, so SQLite work never queues
+# behind itself and never blocks the event loop
+_executor = ThreadPoolExecutor(
+    max_workers=1 + READER_POOL_SIZE,
+    thread_name_prefix="sqlite",
+)
+
+
+def _connect(
+    path: str,
+    read_only: bool = False,
+    mmap_size: int = DEFAULT_MMAP_SIZE,
+    cache_size: int = DEFAULT_CACHE_SIZE,
+) -> sqlite3.Connection:
+    """Open a SQLite connection tuned for concurrent reads and cheap commits"""
+    conn = sqlite3.connect(
+        path,
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
+    cursor = conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=30000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+    cursor.execute(f"PRAGMA cache_size={int(cache_size)}")
+    if read_only:
+        cursor.execute("PRAGMA query_only=ON")
+    return conn
+
+
+async def get_writer(
+    path: str,
+    mmap_size: int = DEFAULT_MMAP_SIZE,
+    cache_size: int = DEFAULT_CACHE_SIZE,
+) -> sqlite3.Connection:
+    """Return the shared writer connection; hold get_writer_lock() while using it
+
+    Tuning arguments only take effect when the connection is first opened,
+    which happens on the database thread pool.
+    """
+    conn = _writers.get(path)
+    if conn is None:
+        conn = _writers[path] = await run_db(_connect, path, False, mmap_size, cache_size)
+    return conn
+
+
+def get_writer_lock(path: str) -> asyncio.Lock:
+    """Return the lock serializing access to the writer connection"""
+    lock = _writer_locks.get(path)
+    if lock is None:
+        lock = _writer_locks[path] = asyncio.Lock()
+    return lock
+
+
+@asynccontextmanager
+async def get_reader(
+    path: str,
+    mmap_size: int = DEFAULT_MMAP_SIZE,
+    cache_size: int = DEFAULT_CACHE_SIZE,
+) -> AsyncIterator[sqlite3.Connection]:
+    """Borrow a read-only connection from the pool and return it when done
+
+    Tuning arguments only take effect when the pool is first created.
+    """
+    pool = _readers.get(path)
+    if pool is None:
+        # Registered before filling so concurrent first callers share one
+        # pool and simply wait for its connections
+        pool = _readers[path] = asyncio.Queue()
+        # Shielded so a cancelled caller cannot leave the pool half filled
+        await asyncio.shield(_fill_readers(pool, path, mmap_size, cache_size))
+
+    conn = await pool.get()
+    try:
+        yield conn
+    finally:
+        pool.put_nowait(conn)
+
+
+async def _fill_readers(
+    pool: "asyncio.Queue[sqlite3.Connection]",
+    path: str,
+    mmap_size: int,
+    cache_size: int,
+) -> None:
+    """Open the read-only connections for a new pool on the database thread pool"""
+    for _ in range(READER_POOL_SIZE):
+        pool.put_nowait(await run_db(_connect, path, True, mmap_size, cache_size))
+
+
+async def run_db(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking SQLite call on the database thread pool
+
+    A thread cannot be interrupted, so if the caller is cancelled this still
+    waits for the call to finish before re-raising. Otherwise the caller's
+    writer lock or pooled reader would be released while a thread is still
+    using the connection.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(_executor, functools.partial(func, *args))
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        while not future.done():
+            try:
+                await asyncio.shield(future)
+            except (asyncio.CancelledError, Exception):
+                pass
+        raise
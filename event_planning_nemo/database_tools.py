@@ -1,11 +1,117 @@
 import sqlite3
 from datetime import datetime
+from typing import Dict, List, Tuple
 from pydantic import BaseModel, Field
 from nat.cli.register_workflow import register_function
 from nat.builder.function_info import FunctionInfo
 from nat.data_models.function import FunctionBaseConfig
 from nat.builder.builder import Builder
 
+from ._db_pool import (
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_MMAP_SIZE,
+    get_reader,
+    get_writer,
+    get_writer_lock,
+    run_db,
+)
+
+# Same schema as database_setup.py; run once per tool at registration
+CREATE_PARTICIPANTS_SQL = """
+    CREATE TABLE IF NOT EXISTS participants (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        email TEXT UNIQUE NOT NULL,
+        company TEXT,
+        role TEXT,
+        phone TEXT,
+        created_at TIMESTAMP
+    )
+"""
+
+# Lets get_participants read the newest rows straight off the index instead of
+# sorting the whole table. Ordering by created_at rather than id keeps results
+# correct for rows backfilled with older timestamps.
+CREATE_PARTICIPANTS_INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_participants_created_at
+    ON participants(created_at DESC)
+"""
+
+# SQL is kept in constants so every call hits the connection's statement cache
+INSERT_PARTICIPANT_SQL = """
+    INSERT INTO participants (name, email, company, role, phone, created_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+SELECT_PARTICIPANTS_SQL = """
+    SELECT id, name, email, company, role
+    FROM participants
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+COUNT_PARTICIPANTS_SQL = "SELECT COUNT(*) FROM participants"
+
+# Row count per database, seeded once at registration and bumped on every insert
+# so get_participants never has to scan the table
+_participant_counts: Dict[str, int] = {}
+
+def _created_at() -> str:
+    """Current time as text, in the same format sqlite3's datetime adapter wrote"""
+    # Binding a ready-made string skips the adapter lookup on every insert and
+    # keeps new rows sorting correctly against existing TIMESTAMP values
+    return datetime.now().isoformat(" ")
+
+def _do_prepare(conn: sqlite3.Connection) -> int:
+    """Create the participants table and index; return the current row count"""
+    with conn:
+        conn.execute(CREATE_PARTICIPANTS_SQL)
+        conn.execute(CREATE_PARTICIPANTS_INDEX_SQL)
+        return conn.execute(COUNT_PARTICIPANTS_SQL).fetchone()[0]
+
+def _do_save(conn: sqlite3.Connection, database_path: str, row: Tuple) -> int:
+    """Insert one participant, count it, and return its id"""
+    with conn:
+        cursor = conn.execute(INSERT_PARTICIPANT_SQL, row)
+    # Counted on the database thread, right after the commit, so a cancelled
+    # tool call cannot leave the cached count behind the table
+    _participant_counts[database_path] += 1
+    return cursor.lastrowid
+
+def _do_save_batch(
+    conn: sqlite3.Connection, database_path: str, rows: List[Tuple]
+) -> List[str]:
+    """Insert and count participants in one transaction; return the emails that already existed"""
+    duplicate_emails = []
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("SAVEPOINT batch")
+        try:
+            conn.executemany(INSERT_PARTICIPANT_SQL, rows)
+        except sqlite3.IntegrityError:
+            # executemany stops at the first conflict, so redo the batch
+            # row by row in the same transaction to find every duplicate
+            conn.execute("ROLLBACK TO batch")
+            for row in rows:
+                try:
+                    conn.execute(INSERT_PARTICIPANT_SQL, row)
+                except sqlite3.IntegrityError:
+                    duplicate_emails.append(row[1])
+        conn.execute("RELEASE batch")
+    _participant_counts[database_path] += len(rows) - len(duplicate_emails)
+    return duplicate_emails
+
+def _do_get(conn: sqlite3.Connection, limit: int) -> List[Tuple]:
+    """Fetch the most recently added participants"""
+    return conn.execute(SELECT_PARTICIPANTS_SQL, (limit,)).fetchall()
+
+async def _prepare_database(config) -> None:
+    """Create the participants table and seed the cached row count"""
+    async with get_writer_lock(config.database_path):
+        conn = await get_writer(config.database_path, config.mmap_size, config.cache_size)
+        count = await run_db(_do_prepare, conn)
+        _participant_counts.setdefault(config.database_path, count)
+
 # ============= Save Participant Tool =============
 class SaveParticipantInput(BaseModel):
     name: str = Field(description="Participant's full name")
@@ -21,29 +127,28 @@ class SaveParticipantOutput(BaseModel):
 
 class SaveParticipantConfig(FunctionBaseConfig, name="save_participant"):
     database_path: str = "event_planning.db"
+    # SQLite read tuning: bytes of memory-mapped I/O and page cache size (negative = KiB)
+    mmap_size: int = DEFAULT_MMAP_SIZE
+    cache_size: int = DEFAULT_CACHE_SIZE
 
 @register_function(config_type=SaveParticipantConfig)
 async def save_participant(config: SaveParticipantConfig, builder: Builder):
+    await _prepare_database(config)
+    
     async def _inner(input_data: SaveParticipantInput) -> SaveParticipantOutput:
         try:
-            conn = sqlite3.connect(config.database_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT INTO participants (name, email, company, role, phone, created_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                input_data.name,
-                input_data.email,
-                input_data.company,
-                input_data.role,
-                input_data.phone,
-                datetime.now()
-            ))
-            
-            participant_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
+            async with get_writer_lock(config.database_path):
+                conn = await get_writer(
+                    config.database_path, config.mmap_size, config.cache_size
+                )
+                participant_id = await run_db(_do_save, conn, config.database_path, (
+                    input_data.name,
+                    input_data.email,
+                    input_data.company,
+                    input_data.role,
+                    input_data.phone,
+                    _created_at()
+                ))
             
             return SaveParticipantOutput(
                 success=True,
@@ -66,6 +171,64 @@ async def save_participant(config: SaveParticipantConfig, builder: Builder):
         description="Save a participant to the event database"
     )
 
+# ============= Save Participants Batch Tool =============
+class SaveParticipantsBatchInput(BaseModel):
+    participants: list[SaveParticipantInput] = Field(description="Participants to save in one transaction")
+
+class SaveParticipantsBatchOutput(BaseModel):
+    success: bool
+    message: str
+    saved_count: int = 0
+    duplicate_emails: list[str] = []
+
+class SaveParticipantsBatchConfig(FunctionBaseConfig, name="save_participants_batch"):
+    database_path: str = "event_planning.db"
+    # SQLite read tuning: bytes of memory-mapped I/O and page cache size (negative = KiB)
+    mmap_size: int = DEFAULT_MMAP_SIZE
+    cache_size: int = DEFAULT_CACHE_SIZE
+
+@register_function(config_type=SaveParticipantsBatchConfig)
+async def save_participants_batch(config: SaveParticipantsBatchConfig, builder: Builder):
+    await _prepare_database(config)
+    
+    async def _inner(input_data: SaveParticipantsBatchInput) -> SaveParticipantsBatchOutput:
+        now = _created_at()
+        rows = [
+            (p.name, p.email, p.company, p.role, p.phone, now)
+            for p in input_data.participants
+        ]
+        
+        try:
+            async with get_writer_lock(config.database_path):
+                conn = await get_writer(
+                    config.database_path, config.mmap_size, config.cache_size
+                )
+                duplicate_emails = await run_db(
+                    _do_save_batch, conn, config.database_path, rows
+                )
+            
+            saved_count = len(rows) - len(duplicate_emails)
+            message = f"Saved {saved_count} of {len(rows)} participants"
+            if duplicate_emails:
+                message += f"; emails already exist: {', '.join(duplicate_emails)}"
+            
+            return SaveParticipantsBatchOutput(
+                success=not duplicate_emails,
+                message=message,
+                saved_count=saved_count,
+                duplicate_emails=duplicate_emails
+            )
+        except Exception as e:
+            return SaveParticipantsBatchOutput(
+                success=False,
+                message=f"Error saving participants: {str(e)}"
+            )
+    
+    yield FunctionInfo.from_fn(
+        _inner,
+        description="Save several participants to the event database in one transaction"
+    )
+
 # ============= Get Participants Tool =============
 class GetParticipantsInput(BaseModel):
     limit: int = Field(default=10, description="Number of participants to retrieve")
@@ -83,32 +246,28 @@ class GetParticipantsOutput(BaseModel):
 
 class GetParticipantsConfig(FunctionBaseConfig, name="get_participants"):
     database_path: str = "event_planning.db"
+    # SQLite read tuning: bytes of memory-mapped I/O and page cache size (negative = KiB)
+    mmap_size: int = DEFAULT_MMAP_SIZE
+    cache_size: int = DEFAULT_CACHE_SIZE
 
 @register_function(config_type=GetParticipantsConfig)
 async def get_participants(config: GetParticipantsConfig, builder: Builder):
+    await _prepare_database(config)
+    
     async def _inner(input_data: GetParticipantsInput) -> GetParticipantsOutput:
         try:
-            conn = sqlite3.connect(config.database_path)
-            cursor = conn.cursor()
+            async with get_reader(
+                config.database_path, config.mmap_size, config.cache_size
+            ) as conn:
+                rows = await run_db(_do_get, conn, input_data.limit)
             
-            cursor.execute("""
-                SELECT id, name, email, company, role 
-                FROM participants 
-                ORDER BY created_at DESC 
-                LIMIT ?
-            """, (input_data.limit,))
+            total_count = _participant_counts[config.database_path]
             
-            rows = cursor.fetchall()
             participants = [
                 Participant(id=row[0], name=row[1], email=row[2], company=row[3], role=row[4])
                 for row in rows
             ]
             
-            cursor.execute("SELECT COUNT(*) FROM participants")
-            total_count = cursor.fetchone()[0]
-            
-            conn.close()
-            
             return GetParticipantsOutput(
                 participants=participants,
                 total_count=total_count
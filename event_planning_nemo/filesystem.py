@@ -3,9 +3,11 @@ MCP Filesystem tools for event planning
 """
 
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
+import anyio
+
 from nat.cli.register_workflow import register_function
 from nat.builder.function_info import FunctionInfo
 from nat.builder.builder import Builder
@@ -21,6 +23,14 @@ class FilesystemConfig(
 
 
 
+def _list_files(directory: Path) -> List[str]:
+    """Names of the regular files in directory"""
+    # DirEntry.is_file() uses the type from the directory listing,
+    # so this avoids a stat() per entry
+    with os.scandir(directory) as entries:
+        return [entry.name for entry in entries if entry.is_file()]
+
+
 @register_function(config_type=FilesystemConfig)
 async def filesystem(
     config: FilesystemConfig,
@@ -30,6 +40,7 @@ async def filesystem(
     
     # Ensure directory exists
     Path(config.allowed_directory).mkdir(parents=True, exist_ok=True)
+    allowed_root = Path(config.allowed_directory).resolve()
     
     async def _inner(
         action: str,
@@ -48,7 +59,7 @@ async def filesystem(
         # Handle list action (doesn't need filename)
         if action == "list":
             try:
-                files = [f.name for f in Path(config.allowed_directory).iterdir() if f.is_file()]
+                files = await anyio.to_thread.run_sync(_list_files, allowed_root)
                 return {
                     "success": True,
                     "action": "list",
@@ -68,10 +79,12 @@ async def filesystem(
                 "error": f"filename is required for action '{action}'"
             }
         
-        filepath = Path(config.allowed_directory) / filename
+        filepath = (allowed_root / filename).resolve()
         
-        # Security check - ensure file is within allowed directory
-        if not str(filepath.resolve()).startswith(str(Path(config.allowed_directory).resolve())):
+        # Security check - ensure file is within allowed directory. Comparing
+        # path components rather than string prefixes stops a sibling such as
+        # "<allowed_dir>_other/file" from slipping through.
+        if filepath != allowed_root and allowed_root not in filepath.parents:
             return {
                 "success": False,
                 "error": "Access denied - file outside allowed directory"
@@ -85,7 +98,7 @@ async def filesystem(
                         "error": f"File not found: {filename}"
                     }
                 
-                content = filepath.read_text()
+                content = await anyio.to_thread.run_sync(filepath.read_text)
                 return {
                     "success": True,
                     "action": "read",
@@ -94,7 +107,7 @@ async def filesystem(
                 }
             
             elif action == "write":
-                filepath.write_text(content)
+                await anyio.to_thread.run_sync(filepath.write_text, content)
                 return {
                     "success": True,
                     "action": "write",
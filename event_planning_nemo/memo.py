@@ -2,10 +2,13 @@
 Memory Storage Tool for Event Planning Agent
 """
 
-import json
 import os
-from typing import Dict, Any, List
+import time
+from collections import deque
 from datetime import datetime
+from typing import Dict, Any, List
+
+import orjson
 
 from nat.cli.register_workflow import register_function
 from nat.builder.function_info import FunctionInfo
@@ -17,6 +20,33 @@ from nat.data_models.function import FunctionBaseConfig
 # Memory Storage Tool
 # ============================================================
 
+# Rewrite the log down to max_history entries once it holds this many times more
+COMPACT_FACTOR = 10
+
+def _is_entry(entry: Any) -> bool:
+    """Whether a decoded value is a usable history entry"""
+    return isinstance(entry, dict) and isinstance(entry.get("content"), str)
+
+
+# In-memory mirror of the last max_history entries per storage path, loaded
+# once at registration so recall and search never touch the disk
+_HISTORY_CACHE: Dict[str, List[Dict]] = {}
+# Lowercased content for each cached entry, kept in step with _HISTORY_CACHE
+_CONTENT_LOWER_CACHE: Dict[str, List[str]] = {}
+
+
+def _display_entry(entry: Dict) -> Dict:
+    """Entry as shown to the agent, with the timestamp as ISO text
+    
+    Entries store epoch nanoseconds; ones migrated from the legacy format
+    already hold ISO strings and are returned unchanged.
+    """
+    timestamp = entry.get("timestamp")
+    if isinstance(timestamp, int):
+        return {**entry, "timestamp": datetime.fromtimestamp(timestamp / 1e9).isoformat()}
+    return entry
+
+
 class MemoryConfig(
     FunctionBaseConfig,
     name="memory_storage",
@@ -30,23 +60,109 @@ async def memory_storage(
     config: MemoryConfig,
     builder: Builder,
 ):
+    # The history is an append-only JSONL log: one entry per line, so a save
+    # writes a single line instead of rewriting the whole file
+    storage_dir = os.path.dirname(config.storage_path)
+    if storage_dir:
+        os.makedirs(storage_dir, exist_ok=True)
+    
     def load_memory() -> List[Dict]:
-        """Load conversation history from file"""
-        if os.path.exists(config.storage_path):
+        """Load the last max_history entries without holding the whole file"""
+        if not os.path.exists(config.storage_path):
+            return []
+        with open(config.storage_path, 'rb') as f:
+            lines = deque(f, maxlen=config.max_history)
+        entries = []
+        for line in lines:
+            # Skip blank, torn and malformed lines; the next compaction
+            # rewrites the log without them
             try:
-                with open(config.storage_path, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                return []
-        return []
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            if _is_entry(entry):
+                entries.append(entry)
+        return entries
+    
+    def has_torn_tail() -> bool:
+        """Whether the log ends in a partial line left by an interrupted append"""
+        if not os.path.exists(config.storage_path):
+            return False
+        with open(config.storage_path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return False
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b'\n'
     
     def save_memory(history: List[Dict]):
-        """Save conversation history to file"""
-        storage_dir = os.path.dirname(config.storage_path)
-        if storage_dir:
-            os.makedirs(storage_dir, exist_ok=True)
-        with open(config.storage_path, 'w') as f:
-            json.dump(history[-config.max_history:], f, indent=2)
+        """Rewrite the log with the given history (used for migration and compaction)"""
+        tmp_path = f"{config.storage_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            for entry in history[-config.max_history:]:
+                f.write(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE))
+        os.replace(tmp_path, config.storage_path)
+    
+    def migrate_legacy_memory():
+        """Convert a pre-JSONL history file (one JSON array) to the log format"""
+        if not os.path.exists(config.storage_path):
+            return
+        with open(config.storage_path, 'rb') as f:
+            head = f.read(64).lstrip()
+            if not head.startswith(b'['):
+                return
+            f.seek(0)
+            try:
+                history = orjson.loads(f.read())
+            except orjson.JSONDecodeError:
+                history = []
+        if not isinstance(history, list):
+            history = []
+        save_memory([entry for entry in history if _is_entry(entry)])
+    
+    def count_entries() -> int:
+        """Count the entries currently in the log"""
+        if not os.path.exists(config.storage_path):
+            return 0
+        with open(config.storage_path, 'rb') as f:
+            return sum(1 for line in f if line.strip())
+    
+    migrate_legacy_memory()
+    entry_count = count_entries()
+    if config.storage_path not in _HISTORY_CACHE:
+        _HISTORY_CACHE[config.storage_path] = load_memory()
+        _CONTENT_LOWER_CACHE[config.storage_path] = [
+            msg["content"].lower() for msg in _HISTORY_CACHE[config.storage_path]
+        ]
+    history = _HISTORY_CACHE[config.storage_path]
+    content_lower = _CONTENT_LOWER_CACHE[config.storage_path]
+    if has_torn_tail():
+        # Compact now rather than later: the next append would otherwise be
+        # glued onto the partial line and lost with it
+        save_memory(history)
+        entry_count = len(history)
+    
+    def append_memory(entry: Dict):
+        """Append one entry, compacting the log once it grows well past max_history"""
+        nonlocal entry_count
+        history.append(entry)
+        content_lower.append(entry["content"].lower())
+        del history[:-config.max_history]
+        del content_lower[:-config.max_history]
+        with open(config.storage_path, 'ab') as f:
+            f.write(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE))
+        entry_count += 1
+        if entry_count > COMPACT_FACTOR * config.max_history:
+            save_memory(history)
+            entry_count = len(history)
+    
+    def clear_memory():
+        """Drop the cached history and truncate the log"""
+        nonlocal entry_count
+        history.clear()
+        content_lower.clear()
+        open(config.storage_path, 'w').close()
+        entry_count = 0
     
     async def _inner(
         action: str,
@@ -62,15 +178,12 @@ async def memory_storage(
         - search: Search memory for specific content
         - clear: Clear all memory
         """
-        history = load_memory()
-        
         if action == "save":
-            history.append({
+            append_memory({
                 "role": role,
                 "content": message,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": time.time_ns()  # epoch nanoseconds
             })
-            save_memory(history)
             return {
                 "success": True,
                 "message": "Memory saved",
@@ -80,7 +193,7 @@ async def memory_storage(
         elif action == "recall":
             return {
                 "success": True,
-                "history": history[-5:],  # Last 5 exchanges
+                "history": [_display_entry(msg) for msg in history[-5:]],  # Last 5 exchanges
                 "total_messages": len(history)
             }
         
@@ -88,9 +201,10 @@ async def memory_storage(
             if not query:
                 return {"success": False, "error": "Query required for search"}
             
+            query_lower = query.lower()
             results = [
-                msg for msg in history
-                if query.lower() in msg["content"].lower()
+                _display_entry(msg) for msg, text in zip(history, content_lower)
+                if query_lower in text
             ]
             return {
                 "success": True,
@@ -99,7 +213,7 @@ async def memory_storage(
             }
         
         elif action == "clear":
-            save_memory([])
+            clear_memory()
             return {
                 "success": True,
                 "message": "Memory cleared"
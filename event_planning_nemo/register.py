@@ -3,10 +3,10 @@ NAT tool registration for Event Planning Agent
 """
 
 import os
-import json
-import sqlite3
-import requests
-from datetime import datetime
+import httpx
+import orjson
+import fastjsonschema
+from cachetools import TTLCache
 from typing import List, Optional, Dict, Any
 
 from nat.cli.register_workflow import register_function
@@ -18,6 +18,15 @@ from langchain_core.messages import SystemMessage, HumanMessage
 
 # Import to register tools
 from .memo import memory_storage, MemoryConfig
+from .filesystem import filesystem, FilesystemConfig
+from .database_tools import (
+    save_participant,
+    save_participants_batch,
+    get_participants,
+    SaveParticipantConfig,
+    SaveParticipantsBatchConfig,
+    GetParticipantsConfig,
+)
 
 # REMOVE THIS LINE - NAT handles MCP integration automatically:
 # from .google_drive_mcp_integration import *
@@ -26,6 +35,15 @@ from .memo import memory_storage, MemoryConfig
 # Generate Event Themes
 # ============================================================
 
+# Compiled once at import; checks the LLM returned exactly 5 theme strings
+THEMES_VALIDATOR = fastjsonschema.compile({
+    "type": "array",
+    "items": {"type": "string"},
+    "minItems": 5,
+    "maxItems": 5,
+})
+
+
 class GenerateEventThemesConfig(
     FunctionBaseConfig,
     name="generate_event_themes",
@@ -55,10 +73,12 @@ async def generate_event_themes(
         ]
 
         response = await llm.ainvoke(messages)
-        themes = json.loads(response.content)
+        themes = orjson.loads(response.content)
 
-        if not isinstance(themes, list) or len(themes) != 5:
-            raise ValueError("LLM must return exactly 5 themes")
+        try:
+            THEMES_VALIDATOR(themes)
+        except fastjsonschema.JsonSchemaException as e:
+            raise ValueError(f"LLM must return exactly 5 themes: {e.message}") from e
 
         return {"themes": themes}
 
@@ -69,208 +89,29 @@ async def generate_event_themes(
 
 
 # ============================================================
-#Filesystem Tool
-# ============================================================
-
-class FilesystemConfig(
-    FunctionBaseConfig,
-    name="filesystem",
-):
-    allowed_directory: str = "/tmp/event_planning"
-
-
-@register_function(config_type=FilesystemConfig)
-async def filesystem(
-    config: FilesystemConfig,
-    builder: Builder,
-):
-    async def _inner(
-        action: str,
-        filename: str = "",
-        content: str = "",
-    ) -> Dict[str, Any]:
-        os.makedirs(config.allowed_directory, exist_ok=True)
-
-        if action == "list":
-            files = [
-                f for f in os.listdir(config.allowed_directory)
-                if os.path.isfile(os.path.join(config.allowed_directory, f))
-            ]
-            return {"success": True, "files": files, "count": len(files)}
-
-        if action == "read":
-            if not filename:
-                return {"success": False, "error": "filename required for read"}
-            path = os.path.join(config.allowed_directory, filename)
-            if not os.path.exists(path):
-                return {"success": False, "error": "File not found"}
-            with open(path) as f:
-                return {"success": True, "content": f.read()}
-
-        if action == "write":
-            if not filename:
-                return {"success": False, "error": "filename required for write"}
-            path = os.path.join(config.allowed_directory, filename)
-            with open(path, "w") as f:
-                f.write(content)
-            return {"success": True, "message": f"Saved to {filename}"}
-
-        return {"success": False, "error": "Unknown action"}
-
-    yield FunctionInfo.from_fn(
-        _inner,
-        description="Manage event planning documents. Actions: list, read, write",
-    )
-
-
-# ============================================================
-# Save Participant
-# ============================================================
-
-class SaveParticipantConfig(
-    FunctionBaseConfig,
-    name="save_participant",
-):
-    database_path: str = "event_planning.db"
-
-
-@register_function(config_type=SaveParticipantConfig)
-async def save_participant(
-    config: SaveParticipantConfig,
-    builder: Builder,
-):
-    async def _inner(
-        name: str,
-        email: str,
-        company: str = "",
-        role: str = "",
-        phone: str = "",
-    ) -> Dict[str, Any]:
-        try:
-            conn = sqlite3.connect(config.database_path)
-            cursor = conn.cursor()
-            
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS participants (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    email TEXT UNIQUE NOT NULL,
-                    company TEXT,
-                    role TEXT,
-                    phone TEXT,
-                    created_at TIMESTAMP
-                )
-                """
-            )
-            
-            cursor.execute(
-                """
-                INSERT INTO participants (name, email, company, role, phone, created_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (name, email, company, role, phone, datetime.now()),
-            )
-            
-            conn.commit()
-            participant_id = cursor.lastrowid
-            conn.close()
-            
-            return {
-                "success": True,
-                "message": f"Participant '{name}' saved successfully",
-                "participant_id": participant_id,
-            }
-            
-        except sqlite3.IntegrityError:
-            return {
-                "success": False,
-                "message": f"Email '{email}' already exists",
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "message": f"Database error: {str(e)}",
-            }
-
-    yield FunctionInfo.from_fn(
-        _inner,
-        description="Save a participant to the event database",
-    )
-
-
-# ============================================================
-# Get Participants
+# Check Weather
 # ============================================================
 
-class GetParticipantsConfig(
-    FunctionBaseConfig,
-    name="get_participants",
-):
-    database_path: str = "event_planning.db"
+# Weather barely changes between consecutive agent steps, so successful
+# lookups are reused for a few minutes
+WEATHER_CACHE_TTL = 300.0
 
+_WEATHER_CLIENT: Optional[httpx.AsyncClient] = None
+# Bounded, so expired cities are evicted instead of piling up
+_WEATHER_CACHE: TTLCache = TTLCache(maxsize=256, ttl=WEATHER_CACHE_TTL)
 
-@register_function(config_type=GetParticipantsConfig)
-async def get_participants(
-    config: GetParticipantsConfig,
-    builder: Builder,
-):
-    async def _inner(limit: int = 10) -> Dict[str, Any]:
-        conn = sqlite3.connect(config.database_path)
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS participants (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                email TEXT UNIQUE NOT NULL,
-                company TEXT,
-                role TEXT,
-                phone TEXT,
-                created_at TIMESTAMP
-            )
-            """
-        )
 
-        cursor.execute(
-            """
-            SELECT id, name, email, company, role
-            FROM participants
-            ORDER BY created_at DESC
-            LIMIT ?
-            """,
-            (limit,),
+def _get_weather_client() -> httpx.AsyncClient:
+    """Return the shared keep-alive client for the OpenWeather API"""
+    global _WEATHER_CLIENT
+    if _WEATHER_CLIENT is None:
+        _WEATHER_CLIENT = httpx.AsyncClient(
+            base_url="http://api.openweathermap.org/data/2.5",
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=4),
         )
+    return _WEATHER_CLIENT
 
-        rows = cursor.fetchall()
-        cursor.execute("SELECT COUNT(*) FROM participants")
-        total_count = cursor.fetchone()[0]
-        conn.close()
-
-        return {
-            "participants": [
-                {
-                    "id": r[0],
-                    "name": r[1],
-                    "email": r[2],
-                    "company": r[3],
-                    "role": r[4],
-                }
-                for r in rows
-            ],
-            "total_count": total_count,
-        }
-
-    yield FunctionInfo.from_fn(
-        _inner,
-        description="Retrieve participants from the event database",
-    )
-
-
-# ============================================================
-# Check Weather
-# ============================================================
 
 class CheckWeatherConfig(
     FunctionBaseConfig,
@@ -284,31 +125,43 @@ async def check_weather(
     config: CheckWeatherConfig,
     builder: Builder,
 ):
+    global _WEATHER_CLIENT
+
     async def _inner(city: str, country_code: str = "US") -> Dict[str, Any]:
         api_key = config.api_key or os.getenv("OPENWEATHER_API_KEY")
         if not api_key:
             return {"success": False, "error": "Missing API key"}
         
+        cache_key = (city.strip().lower(), country_code.strip().lower())
+        cached = _WEATHER_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            response = requests.get(
-                "http://api.openweathermap.org/data/2.5/weather",
+            response = await _get_weather_client().get(
+                "/weather",
                 params={"q": f"{city},{country_code}", "appid": api_key, "units": "metric"},
-                timeout=10,
             )
             if response.status_code != 200:
                 return {"success": False, "error": response.text}
             
             data = response.json()
-            return {
+            result = {
                 "success": True,
                 "city": data["name"],
                 "temperature_celsius": round(data["main"]["temp"], 1),
                 "conditions": data["weather"][0]["main"],
             }
+            _WEATHER_CACHE[cache_key] = result
+            return result
         except Exception as e:
             return {"success": False, "error": str(e)}
 
     yield FunctionInfo.from_fn(
         _inner,
         description="Check weather conditions for event planning",
-    )
\ No newline at end of file
+    )
+
+    if _WEATHER_CLIENT is not None:
+        await _WEATHER_CLIENT.aclose()
+        _WEATHER_CLIENT = None
@@ -4,48 +4,215 @@ Provides tools to manage event documents via Google Drive API
 """
 
 import os
-import json
+import time
+import asyncio
+import random
 import httpx
-from typing import Optional, List, Dict, Any
+import msgspec
+import orjson
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Optional, List, Dict, Any, Tuple
 from enum import Enum
 from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+from urllib.parse import urlencode
+from email.parser import BytesParser
+
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
 
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
+# Shared client for every Drive endpoint (metadata, upload and batch), created
+# on first use so one TLS handshake and one HTTP/2 connection carry all calls
+_DRIVE_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def get_drive_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client for Drive API calls."""
+    global _DRIVE_CLIENT
+    if _DRIVE_CLIENT is None:
+        _DRIVE_CLIENT = httpx.AsyncClient(
+            # Google only gzips responses when the User-Agent also says "gzip"
+            headers={"Accept-Encoding": "gzip", "User-Agent": "google_drive_mcp (gzip)"},
+            timeout=httpx.Timeout(connect=5.0, read=30.0, write=30.0, pool=5.0),
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+        )
+    return _DRIVE_CLIENT
+
+
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close shared HTTP clients when the server shuts down."""
+    global _DRIVE_CLIENT
+    try:
+        yield
+    finally:
+        if _DRIVE_CLIENT is not None:
+            await _DRIVE_CLIENT.aclose()
+            _DRIVE_CLIENT = None
+
+
 # Initialize MCP server
-mcp = FastMCP("google_drive_mcp")
+mcp = FastMCP("google_drive_mcp", lifespan=server_lifespan)
 
 # Constants
 GOOGLE_DRIVE_API_BASE = "https://www.googleapis.com/drive/v3"
 GOOGLE_DRIVE_UPLOAD_BASE = "https://www.googleapis.com/upload/drive/v3"
+GOOGLE_DRIVE_BATCH_URL = "https://www.googleapis.com/batch/drive/v3"
+# Drive accepts at most this many calls in one batch request
+BATCH_MAX_REQUESTS = 100
+# Throttled requests are retried with jittered exponential backoff, honouring
+# Retry-After when the server sends one
+RETRY_STATUS_CODES = frozenset({429, 503})
+MAX_RETRIES = 5
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 8.0
+
+# Query clauses and field masks sent on every call, built once at import.
+# JSON output returns whatever Drive sent, so it gets the full mask; markdown
+# only asks for the fields its formatter renders.
+TRASHED_FILTER = "trashed=false"
+LIST_FILES_FIELDS = "nextPageToken, files(id, name, mimeType, size, createdTime, modifiedTime, webViewLink)"
+LIST_FILES_MARKDOWN_FIELDS = "nextPageToken, files(id, name, mimeType, modifiedTime)"
+LIST_FILES_COMPACT_FIELDS = "nextPageToken, files(id, name, mimeType)"
+GET_FILE_FIELDS = (
+    "id, name, mimeType, size, createdTime, modifiedTime, webViewLink, "
+    "webContentLink, description, parents, owners, permissions"
+)
+GET_FILE_MARKDOWN_FIELDS = "id, name, mimeType, size, createdTime, modifiedTime, webViewLink"
+SEARCH_FILES_FIELDS = "files(id, name, mimeType, modifiedTime, webViewLink)"
+SEARCH_FILES_MARKDOWN_FIELDS = "files(id, name, mimeType, modifiedTime)"
 
 # ============================================================
 # Shared Utilities
 # ============================================================
 
+# Short-lived cache of read-only Drive responses. Keys start with the tool name;
+# any write through these tools clears the whole cache.
+_LIST_CACHE: TTLCache = TTLCache(maxsize=512, ttl=60)
+# Bumped on every invalidation, so a read that started before a write cannot
+# put its stale response back into the cache after the write cleared it
+_CACHE_GENERATION = 0
+
+# GET requests currently on the wire, so identical concurrent reads share one
+# round trip instead of each hitting the API
+_INFLIGHT: Dict[tuple, "asyncio.Task[Any]"] = {}
+
+# Client-side pacing a little under Drive's 10 requests/second per-user quota,
+# so bursts of tool calls queue here instead of coming back as 429s
+_RATE = AsyncLimiter(max_rate=8, time_period=1.0)
+
+# Page size that marks a list call as a bulk enumeration, worth fetching the
+# following page for ahead of time
+PREFETCH_PAGE_SIZE = 100
+# At most this many speculative page fetches run at once
+_PREFETCH_SLOTS = asyncio.Semaphore(2)
+_PREFETCH_TASKS: set = set()
+# Cache keys with a prefetch scheduled or running, so coalesced callers that
+# all see the same next page token only schedule it once
+_PREFETCH_PENDING: set = set()
+
+# Google access tokens last an hour; the cached one is refreshed a little
+# before that, or straight away when Drive answers 401
+ACCESS_TOKEN_TTL = 3300.0
+_ACCESS_TOKEN: Optional[Tuple[str, float]] = None
+
 class ResponseFormat(str, Enum):
     """Output format for tool responses."""
     MARKDOWN = "markdown"
     JSON = "json"
 
 
+class DriveFile(msgspec.Struct, omit_defaults=True, gc=False):
+    """File entry from a Drive files.list response.
+    
+    Field names match the API. Fields outside the requested mask stay None
+    and are left out again when the file is serialized.
+    """
+    id: str
+    name: Optional[str] = None
+    mimeType: Optional[str] = None
+    size: Optional[str] = None
+    createdTime: Optional[str] = None
+    modifiedTime: Optional[str] = None
+    webViewLink: Optional[str] = None
+
+
+class DriveFileList(msgspec.Struct, omit_defaults=True, gc=False):
+    """Drive files.list response."""
+    files: List[DriveFile] = []
+    nextPageToken: Optional[str] = None
+
+
+# files.list bodies are decoded straight into structs instead of dicts
+FILE_LIST_DECODER = msgspec.json.Decoder(DriveFileList)
+
+
 def get_access_token() -> str:
-    """Get Google Drive access token from environment."""
+    """Get Google Drive access token from environment, reusing it until it expires."""
+    global _ACCESS_TOKEN
+    if _ACCESS_TOKEN is not None and time.monotonic() < _ACCESS_TOKEN[1]:
+        return _ACCESS_TOKEN[0]
     token = os.getenv("GOOGLE_DRIVE_ACCESS_TOKEN")
     if not token:
         raise ValueError("GOOGLE_DRIVE_ACCESS_TOKEN environment variable not set")
+    _ACCESS_TOKEN = (token, time.monotonic() + ACCESS_TOKEN_TTL)
     return token
 
 
+def invalidate_access_token() -> None:
+    """Forget the cached access token so the next call fetches it again."""
+    global _ACCESS_TOKEN
+    _ACCESS_TOKEN = None
+
+
 async def make_drive_request(
     method: str,
     endpoint: str,
     params: Optional[Dict] = None,
     json_data: Optional[Dict] = None,
-    files: Optional[Dict] = None
-) -> Dict[str, Any]:
-    """Make authenticated request to Google Drive API."""
+    files: Optional[Dict] = None,
+    decoder: Optional[msgspec.json.Decoder] = None
+) -> Any:
+    """Make authenticated request to Google Drive API.
+    
+    Responses are returned as dicts, or decoded with `decoder` when one is
+    given. Errors are always returned as a dict with an "error" key.
+    
+    Concurrent identical GETs are coalesced into a single request; other
+    methods always go straight through.
+    """
+    if method != "GET":
+        return await _send_drive_request(method, endpoint, params, json_data, files, decoder)
+    
+    key = (endpoint, frozenset((params or {}).items()), decoder)
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _send_drive_request(method, endpoint, params, decoder=decoder)
+        )
+        _INFLIGHT[key] = task
+        # Only remove our own entry; invalidate_cache() may have replaced it
+        task.add_done_callback(
+            lambda done: _INFLIGHT.pop(key) if _INFLIGHT.get(key) is done else None
+        )
+    # Shielded so one caller being cancelled does not cancel the shared request
+    return await asyncio.shield(task)
+
+
+async def _send_drive_request(
+    method: str,
+    endpoint: str,
+    params: Optional[Dict] = None,
+    json_data: Optional[Dict] = None,
+    files: Optional[Dict] = None,
+    decoder: Optional[msgspec.json.Decoder] = None
+) -> Any:
+    """Send a single authenticated request to Google Drive API."""
     token = get_access_token()
     headers = {
         "Authorization": f"Bearer {token}",
@@ -56,53 +223,388 @@ async def make_drive_request(
     
     url = f"{GOOGLE_DRIVE_API_BASE}/{endpoint}"
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    client = get_drive_client()
+    
+    async def send() -> httpx.Response:
+        if method == "GET":
+            return await client.get(url, headers=headers, params=params)
+        elif method == "POST":
+            if files:
+                return await client.post(url, headers=headers, files=files, data=json_data, params=params)
+            return await client.post(url, headers=headers, json=json_data, params=params)
+        elif method == "PATCH":
+            return await client.patch(url, headers=headers, json=json_data, params=params)
+        elif method == "DELETE":
+            return await client.delete(url, headers=headers)
+        raise ValueError(f"Unsupported HTTP method: {method}")
+    
+    try:
+        response = await send_authorized(send, headers)
+        response.raise_for_status()
+        
+        # Handle empty responses (e.g., DELETE)
+        if response.status_code == 204 or not response.content:
+            return {"success": True}
+        
+        if decoder is not None:
+            return decoder.decode(response.content)
+        return _parse_response(response)
+        
+    except httpx.HTTPStatusError as e:
+        return status_error(e.response.status_code, e.response.text)
+    except httpx.TimeoutException:
+        return {"error": "Request timed out. Please try again."}
+    except Exception as e:
+        return {"error": f"Unexpected error: {str(e)}"}
+
+
+def _parse_response(response: httpx.Response) -> Dict[str, Any]:
+    """Decode a Drive JSON response body with orjson."""
+    return orjson.loads(response.content)
+
+
+async def send_authorized(
+    send: Callable[[], Awaitable[httpx.Response]],
+    headers: Dict[str, str],
+    cost: int = 1
+) -> httpx.Response:
+    """Send a paced request; if Drive rejects the token, refresh it and retry once.
+    
+    `send` must read `headers` on every call, so the retry picks up the new
+    Authorization header. Nothing is resent when the token source hands back
+    the same token, since that request would be rejected the same way.
+    """
+    response = await send_paced(send, cost)
+    if response.status_code == 401:
+        invalidate_access_token()
+        authorization = f"Bearer {get_access_token()}"
+        if authorization != headers.get("Authorization"):
+            headers["Authorization"] = authorization
+            response = await send_paced(send, cost)
+    return response
+
+
+async def send_paced(
+    send: Callable[[], Awaitable[httpx.Response]],
+    cost: int = 1
+) -> httpx.Response:
+    """Send a request under the client-side rate limit, retrying when throttled.
+    
+    `send` is called once per attempt, and each attempt takes `cost` tokens
+    from the limiter (Drive counts every call inside a batch). The last
+    response is returned as-is, so callers still see the 429/503 if every
+    retry was throttled or the server asked for too long a wait.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        # The limiter hands out at most max_rate tokens at once, so take a
+        # batch's extra tokens one by one
+        for _ in range(cost - 1):
+            await _RATE.acquire()
+        async with _RATE:
+            response = await send()
+        if response.status_code not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+            return response
+        delay = retry_delay(response, attempt)
+        if delay is None:
+            return response
+        await asyncio.sleep(delay)
+    return response
+
+
+def retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying a throttled response, or None to give up.
+    
+    A Retry-After longer than BACKOFF_MAX is not waited out, so a throttled
+    call fails fast instead of stalling the tool.
+    """
+    retry_after = response.headers.get("Retry-After", "")
+    try:
+        delay = float(retry_after)
+    except ValueError:
+        # Missing or an HTTP date; fall back to exponential backoff with jitter
+        return backoff_delay(attempt)
+    # Written this way round so "inf" and "nan" are rejected too
+    if not delay <= BACKOFF_MAX:
+        return None
+    return max(delay, 0.0)
+
+
+def backoff_delay(attempt: int) -> float:
+    """Jittered exponential backoff for the given retry attempt."""
+    delay = min(BACKOFF_BASE * 2 ** attempt, BACKOFF_MAX)
+    return random.uniform(delay / 2, delay)
+
+
+def status_error(status_code: int, error_detail: str) -> Dict[str, Any]:
+    """Map a failed Drive API status code to a tool error."""
+    if status_code == 401:
+        return {"error": "Authentication failed. Please check your access token."}
+    elif status_code == 403:
+        return {"error": "Permission denied. Check that you have access to this resource."}
+    elif status_code == 404:
+        return {"error": "Resource not found. Please verify the file/folder ID."}
+    elif status_code == 429:
+        return {"error": "Rate limit exceeded. Please wait before making more requests."}
+    return {"error": f"API request failed: {error_detail}"}
+
+
+async def make_drive_batch_request(
+    calls: List[Tuple[str, str, Optional[Dict], Optional[Dict]]]
+) -> List[Dict[str, Any]]:
+    """Send several metadata calls through Drive's batch endpoint.
+    
+    Each call is (method, endpoint, params, json_data). Calls are packed into
+    multipart/mixed requests of up to BATCH_MAX_REQUESTS each, and the results
+    are returned in the same order as the calls. Calls that Drive throttles
+    inside a batch are sent again with backoff, like single requests.
+    """
+    results: List[Dict[str, Any]] = [{} for _ in calls]
+    pending = list(range(len(calls)))
+    for attempt in range(MAX_RETRIES + 1):
+        throttled = []
+        for start in range(0, len(pending), BATCH_MAX_REQUESTS):
+            chunk = pending[start:start + BATCH_MAX_REQUESTS]
+            replies = await _send_drive_batch([calls[index] for index in chunk])
+            for index, (status_code, result) in zip(chunk, replies):
+                results[index] = result
+                if status_code in RETRY_STATUS_CODES:
+                    throttled.append(index)
+        if not throttled or attempt == MAX_RETRIES:
+            break
+        pending = throttled
+        await asyncio.sleep(backoff_delay(attempt))
+    return results
+
+
+def build_batch_body(
+    calls: List[Tuple[str, str, Optional[Dict], Optional[Dict]]],
+    boundary: str
+) -> bytes:
+    """Encode calls as a multipart/mixed batch body, one application/http part each."""
+    parts = []
+    for index, (method, endpoint, params, json_data) in enumerate(calls):
+        path = f"/drive/v3/{endpoint}"
+        if params:
+            path += f"?{urlencode(params)}"
+        part = (
+            f"--{boundary}\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: <item{index}>\r\n\r\n"
+            f"{method} {path} HTTP/1.1\r\n"
+        ).encode()
+        if json_data is not None:
+            part += b"Content-Type: application/json; charset=UTF-8\r\n\r\n" + orjson.dumps(json_data)
+        else:
+            part += b"\r\n"
+        parts.append(part + b"\r\n")
+    return b"".join(parts) + f"--{boundary}--\r\n".encode()
+
+
+def parse_batch_response(
+    content_type: str,
+    content: bytes,
+    count: int
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """Split a multipart/mixed batch response into one (status, result) per call.
+    
+    Results are matched to calls by Content-ID. A part that is missing or
+    cannot be parsed becomes an error for that call only, with status 0.
+    """
+    # Parse the multipart/mixed envelope, then the HTTP response inside each part
+    envelope = BytesParser().parsebytes(
+        b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + content
+    )
+    results: List[Tuple[int, Dict[str, Any]]] = [
+        (0, {"error": "No response for this request in the batch."}) for _ in range(count)
+    ]
+    if not envelope.is_multipart():
+        return results
+    for part in envelope.get_payload():
+        content_id = part.get("Content-ID", "")
+        index = content_id.strip("<>").rsplit("item", 1)[-1]
+        if not index.isdigit() or int(index) >= count:
+            continue
+        raw = part.get_payload(decode=True) or b""
+        head, _, payload = raw.replace(b"\r\n", b"\n").partition(b"\n\n")
+        status_code = 0
         try:
-            if method == "GET":
-                response = await client.get(url, headers=headers, params=params)
-            elif method == "POST":
-                if files:
-                    response = await client.post(url, headers=headers, files=files, data=json_data, params=params)
-                else:
-                    response = await client.post(url, headers=headers, json=json_data, params=params)
-            elif method == "PATCH":
-                response = await client.patch(url, headers=headers, json=json_data, params=params)
-            elif method == "DELETE":
-                response = await client.delete(url, headers=headers)
+            status_code = int(head.split(b" ", 2)[1])
+            if status_code >= 400:
+                result = status_error(status_code, payload.decode(errors="replace"))
+            elif payload.strip():
+                result = orjson.loads(payload)
             else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            response.raise_for_status()
-            
-            # Handle empty responses (e.g., DELETE)
-            if response.status_code == 204 or not response.content:
-                return {"success": True}
-            
-            return response.json()
-            
-        except httpx.HTTPStatusError as e:
-            error_detail = e.response.text
-            if e.response.status_code == 401:
-                return {"error": "Authentication failed. Please check your access token."}
-            elif e.response.status_code == 403:
-                return {"error": "Permission denied. Check that you have access to this resource."}
-            elif e.response.status_code == 404:
-                return {"error": "Resource not found. Please verify the file/folder ID."}
-            elif e.response.status_code == 429:
-                return {"error": "Rate limit exceeded. Please wait before making more requests."}
-            return {"error": f"API request failed: {error_detail}"}
-        except httpx.TimeoutException:
-            return {"error": "Request timed out. Please try again."}
-        except Exception as e:
-            return {"error": f"Unexpected error: {str(e)}"}
-
-
-def format_file_info(file: Dict[str, Any], format_type: ResponseFormat) -> str:
-    """Format file information based on response format."""
-    if format_type == ResponseFormat.JSON:
-        return json.dumps(file, indent=2)
-    
-    # Markdown format
+                result = {"success": True}
+        except (IndexError, ValueError) as e:
+            result = {"error": f"Could not parse batch response: {str(e)}"}
+        results[int(index)] = (status_code, result)
+    return results
+
+
+async def _send_drive_batch(
+    calls: List[Tuple[str, str, Optional[Dict], Optional[Dict]]]
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """Send one batch request and split its multipart/mixed response.
+    
+    A failure of the batch request itself is reported for every call with
+    status 0; send_paced has already retried it if it was throttled.
+    """
+    boundary = f"batch_{uuid4().hex}"
+    body = build_batch_body(calls, boundary)
+    
+    headers = {
+        "Authorization": f"Bearer {get_access_token()}",
+        "Content-Type": f"multipart/mixed; boundary={boundary}",
+    }
+    
+    try:
+        response = await send_authorized(
+            lambda: get_drive_client().post(GOOGLE_DRIVE_BATCH_URL, headers=headers, content=body),
+            headers,
+            cost=len(calls)
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        return [(0, status_error(e.response.status_code, e.response.text))] * len(calls)
+    except httpx.TimeoutException:
+        return [(0, {"error": "Request timed out. Please try again."})] * len(calls)
+    except Exception as e:
+        return [(0, {"error": f"Unexpected error: {str(e)}"})] * len(calls)
+    
+    return parse_batch_response(
+        response.headers.get("content-type", ""), response.content, len(calls)
+    )
+
+
+def drive_escape(value: str) -> str:
+    """Escape a value for use inside a single-quoted Drive query string."""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+def is_error(result: Any) -> bool:
+    """Whether a make_drive_request result is an error rather than a response."""
+    return isinstance(result, dict) and "error" in result
+
+
+def cache_get(key: tuple) -> Any:
+    """Return a cached Drive response, if still fresh."""
+    return _LIST_CACHE.get(key)
+
+
+def cache_generation() -> int:
+    """Current cache generation; capture it before fetching a response to cache."""
+    return _CACHE_GENERATION
+
+
+def cache_put(key: tuple, result: Any, generation: int) -> None:
+    """Cache a successful Drive response, unless the cache was invalidated
+    since `generation` was captured."""
+    if not is_error(result) and generation == _CACHE_GENERATION:
+        _LIST_CACHE[key] = result
+
+
+def invalidate_cache() -> None:
+    """Drop cached responses after Drive contents change."""
+    global _CACHE_GENERATION
+    _CACHE_GENERATION += 1
+    _LIST_CACHE.clear()
+    # Reads already on the wire may predate the change; later reads must not
+    # join them
+    _INFLIGHT.clear()
+
+
+def prefetch_list_page(cache_key: tuple, api_params: Dict[str, Any]) -> None:
+    """Fetch a list page in the background so the caller's next call hits the cache.
+    
+    Skipped when the page is already cached or being prefetched, both prefetch
+    slots are busy, or the rate limiter has no spare capacity for a
+    speculative request.
+    """
+    if (
+        cache_key in _LIST_CACHE
+        or cache_key in _PREFETCH_PENDING
+        or _PREFETCH_SLOTS.locked()
+        or not _RATE.has_capacity()
+    ):
+        return
+    _PREFETCH_PENDING.add(cache_key)
+    task = asyncio.ensure_future(
+        _prefetch_list_page(cache_key, api_params, cache_generation())
+    )
+    # Keep a reference so the task is not garbage collected mid-flight
+    _PREFETCH_TASKS.add(task)
+    task.add_done_callback(_PREFETCH_TASKS.discard)
+    task.add_done_callback(lambda _: _PREFETCH_PENDING.discard(cache_key))
+
+
+async def _prefetch_list_page(
+    cache_key: tuple,
+    api_params: Dict[str, Any],
+    generation: int
+) -> None:
+    """Fetch one list page and cache it."""
+    async with _PREFETCH_SLOTS:
+        # The page may have been fetched explicitly while waiting for a slot
+        if cache_key in _LIST_CACHE:
+            return
+        # Goes through make_drive_request, so an explicit call for the same
+        # page while this is in flight shares the request
+        cache_put(cache_key, await make_drive_request(
+            "GET", "files", params=api_params, decoder=FILE_LIST_DECODER
+        ), generation)
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize values orjson has no native encoder for."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps_json(data: Any) -> str:
+    """Serialize tool output to compact JSON in a single pass."""
+    return orjson.dumps(data, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _multipart_delimiters(boundary: bytes) -> Tuple[bytes, bytes, bytes, str]:
+    """Pre-encode the fixed parts of a multipart/related body for one boundary."""
+    return (
+        b"--" + boundary + b"\r\nContent-Type: application/json; charset=UTF-8\r\n\r\n",
+        b"\r\n--" + boundary + b"\r\nContent-Type: ",
+        b"\r\n--" + boundary + b"--\r\n",
+        f"multipart/related; boundary={boundary.decode()}",
+    )
+
+
+# Upload boundary picked once per process, with its delimiters encoded up front
+_UPLOAD_BOUNDARY = uuid4().hex.encode()
+_UPLOAD_DELIMITERS = _multipart_delimiters(_UPLOAD_BOUNDARY)
+
+
+def build_multipart_related(
+    metadata: Dict[str, Any],
+    content: bytes,
+    mime_type: str
+) -> Tuple[bytes, str]:
+    """Build a Drive multipart upload body; returns (body, Content-Type header)."""
+    metadata_json = orjson.dumps(metadata)
+    delimiters = _UPLOAD_DELIMITERS
+    # A boundary must not occur inside the parts; fall back to a fresh one in
+    # the unlikely case this upload contains the shared boundary
+    if _UPLOAD_BOUNDARY in content or _UPLOAD_BOUNDARY in metadata_json:
+        delimiters = _multipart_delimiters(uuid4().hex.encode())
+    head, middle, tail, content_type = delimiters
+    body = b"".join((
+        head, metadata_json,
+        middle, mime_type.encode(), b"\r\n\r\n",
+        content,
+        tail,
+    ))
+    return body, content_type
+
+
+def format_file_info(file: Dict[str, Any]) -> str:
+    """Format file information as markdown; JSON output uses dumps_json."""
     file_type = file.get("mimeType", "unknown")
     size = file.get("size", "N/A")
     if size != "N/A" and size.isdigit():
@@ -123,46 +625,69 @@ def format_file_info(file: Dict[str, Any], format_type: ResponseFormat) -> str:
     return md
 
 
-def format_file_list(files: List[Dict], format_type: ResponseFormat, total: int = 0) -> str:
-    """Format list of files based on response format."""
-    if format_type == ResponseFormat.JSON:
-        return json.dumps({
-            "files": files,
-            "count": len(files),
-            "total": total
-        }, indent=2)
-    
-    # Markdown format
+def dumps_file_list(
+    files: List[DriveFile],
+    total: int = 0,
+    next_page_token: Optional[str] = None
+) -> str:
+    """Serialize a file list to JSON, encoding the structs natively with msgspec."""
+    data = {
+        "files": files,
+        "count": len(files),
+        "total": total
+    }
+    if next_page_token:
+        data["nextPageToken"] = next_page_token
+    return msgspec.json.encode(data).decode()
+
+
+def format_file_list(
+    files: List[DriveFile],
+    total: int = 0,
+    next_page_token: Optional[str] = None
+) -> str:
+    """Format list of files as markdown; JSON output uses dumps_file_list."""
     md = f"# Files ({len(files)} shown"
     if total > 0:
         md += f", {total} total"
     md += ")\n\n"
     
     for file in files:
-        name = file.get('name', 'Unnamed')
-        file_id = file.get('id', 'N/A')
-        mime_type = file.get('mimeType', 'unknown')
-        modified = file.get('modifiedTime', 'Unknown')
+        name = file.name if file.name is not None else 'Unnamed'
+        mime_type = file.mimeType or 'unknown'
         
-        md += f"- **{name}** (`{file_id}`)\n"
+        md += f"- **{name}** (`{file.id}`)\n"
         md += f"  - Type: {mime_type}\n"
-        md += f"  - Modified: {modified}\n\n"
+        # Compact listings do not fetch modifiedTime
+        if file.modifiedTime is not None:
+            md += f"  - Modified: {file.modifiedTime}\n"
+        md += "\n"
+    
+    if next_page_token:
+        md += f"\n**Next Page Token**: {next_page_token}\n"
+        md += "Use this token in the `page_token` parameter to get the next page of results.\n"
     
     return md
 
 
+class _DriveInputBase(BaseModel):
+    """Base for tool inputs; one shared config instead of a copy per model.
+    
+    Inputs are frozen: tools only read them, and frozen models are hashable.
+    """
+    model_config = ConfigDict(
+        str_strip_whitespace=True,
+        extra='forbid',
+        frozen=True
+    )
+
+
 # ============================================================
 # Tool: List Files
 # ============================================================
 
-class ListFilesInput(BaseModel):
+class ListFilesInput(_DriveInputBase):
     """Input parameters for listing files in Google Drive."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
-    
     query: Optional[str] = Field(
         default=None,
         description="Search query using Google Drive query syntax (e.g., \"name contains 'event'\" or \"mimeType='application/pdf'\")"
@@ -181,6 +706,14 @@ class ListFilesInput(BaseModel):
         default=None,
         description="Page token for pagination (from previous response)"
     )
+    include_trashed: bool = Field(
+        default=False,
+        description="Also return files in the trash"
+    )
+    compact: bool = Field(
+        default=False,
+        description="Return only file ID, name and type, e.g. when picking a file from a list"
+    )
     response_format: ResponseFormat = Field(
         default=ResponseFormat.MARKDOWN,
         description="Output format: 'markdown' for human-readable or 'json' for machine-readable"
@@ -209,6 +742,8 @@ async def google_drive_list_files(params: ListFilesInput) -> str:
             - folder_id: Optional folder to search within
             - limit: Maximum results (1-100)
             - page_token: Pagination token
+            - include_trashed: Also return trashed files
+            - compact: Only return ID, name and type
             - response_format: 'markdown' or 'json'
     
     Returns:
@@ -218,23 +753,27 @@ async def google_drive_list_files(params: ListFilesInput) -> str:
             - Web view links
             - Pagination info (next_page_token if more results exist)
     """
-    # Build query
-    query_parts = []
-    if params.query:
-        query_parts.append(params.query)
-    
+    # Build query, excluding trashed files unless asked to include them
     if params.folder_id:
-        query_parts.append(f"'{params.folder_id}' in parents")
+        q = f"'{drive_escape(params.folder_id)}' in parents"
+        if params.query:
+            q = f"{params.query} and {q}"
+    else:
+        q = params.query
+    if not params.include_trashed:
+        q = f"{q} and {TRASHED_FILTER}" if q else TRASHED_FILTER
     
-    # Exclude trashed files
-    query_parts.append("trashed=false")
-    
-    q = " and ".join(query_parts) if query_parts else None
+    if params.compact:
+        fields = LIST_FILES_COMPACT_FIELDS
+    elif params.response_format == ResponseFormat.JSON:
+        fields = LIST_FILES_FIELDS
+    else:
+        fields = LIST_FILES_MARKDOWN_FIELDS
     
     # Make API request
     api_params = {
         "pageSize": params.limit,
-        "fields": "nextPageToken, files(id, name, mimeType, size, createdTime, modifiedTime, webViewLink)"
+        "fields": fields
     }
     
     if q:
@@ -243,35 +782,39 @@ async def google_drive_list_files(params: ListFilesInput) -> str:
     if params.page_token:
         api_params["pageToken"] = params.page_token
     
-    result = await make_drive_request("GET", "files", params=api_params)
+    cache_key = ("list", q, fields, params.limit, params.page_token)
+    result = cache_get(cache_key)
+    if result is None:
+        generation = cache_generation()
+        result = await make_drive_request(
+            "GET", "files", params=api_params, decoder=FILE_LIST_DECODER
+        )
+        cache_put(cache_key, result, generation)
     
-    if "error" in result:
+    if is_error(result):
         return f"Error: {result['error']}"
     
-    files = result.get("files", [])
-    next_token = result.get("nextPageToken")
+    files = result.files
+    next_token = result.nextPageToken
     
-    output = format_file_list(files, params.response_format)
+    # A full-size page usually means the caller is walking the whole listing
+    if next_token and params.limit == PREFETCH_PAGE_SIZE:
+        prefetch_list_page(
+            ("list", q, fields, params.limit, next_token),
+            {**api_params, "pageToken": next_token}
+        )
     
-    if next_token:
-        output += f"\n**Next Page Token**: {next_token}\n"
-        output += "Use this token in the `page_token` parameter to get the next page of results.\n"
-    
-    return output
+    if params.response_format == ResponseFormat.JSON:
+        return dumps_file_list(files, next_page_token=next_token)
+    return format_file_list(files, next_page_token=next_token)
 
 
 # ============================================================
 # Tool: Get File Details
 # ============================================================
 
-class GetFileInput(BaseModel):
+class GetFileInput(_DriveInputBase):
     """Input parameters for getting file details."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
-    
     file_id: str = Field(
         ...,
         description="Google Drive file ID",
@@ -304,35 +847,39 @@ async def google_drive_get_file(params: GetFileInput) -> str:
             - response_format: 'markdown' or 'json'
     
     Returns:
-        str: Detailed file information including name, type, size, dates, permissions, and links
+        str: Detailed file information including name, type, size, dates and links;
+            JSON output also includes description, parents, owners and permissions
     """
-    result = await make_drive_request(
-        "GET",
-        f"files/{params.file_id}",
-        params={
-            "fields": "id, name, mimeType, size, createdTime, modifiedTime, webViewLink, "
-                     "webContentLink, description, parents, owners, permissions"
-        }
-    )
+    if params.response_format == ResponseFormat.JSON:
+        fields = GET_FILE_FIELDS
+    else:
+        fields = GET_FILE_MARKDOWN_FIELDS
+    
+    cache_key = ("get", params.file_id, fields)
+    result = cache_get(cache_key)
+    if result is None:
+        generation = cache_generation()
+        result = await make_drive_request(
+            "GET",
+            f"files/{params.file_id}",
+            params={"fields": fields}
+        )
+        cache_put(cache_key, result, generation)
     
     if "error" in result:
         return f"Error: {result['error']}"
     
-    return format_file_info(result, params.response_format)
+    if params.response_format == ResponseFormat.JSON:
+        return dumps_json(result)
+    return format_file_info(result)
 
 
 # ============================================================
 # Tool: Create Folder
 # ============================================================
 
-class CreateFolderInput(BaseModel):
+class CreateFolderInput(_DriveInputBase):
     """Input parameters for creating a folder."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
-    
     name: str = Field(
         ...,
         description="Folder name (e.g., 'Tech Conference 2026')",
@@ -391,21 +938,100 @@ async def google_drive_create_folder(params: CreateFolderInput) -> str:
     if "error" in result:
         return f"Error: {result['error']}"
     
-    return format_file_info(result, params.response_format)
+    invalidate_cache()
+    if params.response_format == ResponseFormat.JSON:
+        return dumps_json(result)
+    return format_file_info(result)
 
 
 # ============================================================
-# Tool: Upload File
+# Tool: Create Folders (batch)
 # ============================================================
 
-class UploadFileInput(BaseModel):
-    """Input parameters for uploading a file."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
+class CreateFoldersInput(_DriveInputBase):
+    """Input parameters for creating several folders at once."""
+    names: List[str] = Field(
+        ...,
+        description="Folder names (e.g., ['Venue', 'Catering', 'Speakers'])",
+        min_length=1,
+        max_length=BATCH_MAX_REQUESTS
+    )
+    parent_folder_id: Optional[str] = Field(
+        default=None,
+        description="Parent folder ID for all new folders (root if not specified)"
     )
+    response_format: ResponseFormat = Field(
+        default=ResponseFormat.MARKDOWN,
+        description="Output format: 'markdown' or 'json'"
+    )
+
+
+@mcp.tool(
+    name="google_drive_create_folders",
+    annotations={
+        "title": "Create Folders",
+        "readOnlyHint": False,
+        "destructiveHint": False,
+        "idempotentHint": False,
+        "openWorldHint": True
+    }
+)
+async def google_drive_create_folders(params: CreateFoldersInput) -> str:
+    """Create several folders in Google Drive with a single batch request.
+    
+    Set up an event's folder structure in one step instead of one call per folder.
+    
+    Args:
+        params (CreateFoldersInput): Parameters including:
+            - names: Folder names to create
+            - parent_folder_id: Optional parent folder ID
+            - response_format: 'markdown' or 'json'
+    
+    Returns:
+        str: Created folder details, plus any folders that failed
+    """
+    calls = []
+    for name in params.names:
+        metadata = {
+            "name": name,
+            "mimeType": "application/vnd.google-apps.folder"
+        }
+        if params.parent_folder_id:
+            metadata["parents"] = [params.parent_folder_id]
+        calls.append(("POST", "files", {"fields": "id, name, webViewLink"}, metadata))
+    
+    results = await make_drive_batch_request(calls)
     
+    created: List[DriveFile] = []
+    errors = []
+    for name, result in zip(params.names, results):
+        if "error" not in result:
+            try:
+                created.append(msgspec.convert(result, DriveFile))
+                continue
+            except msgspec.ValidationError as e:
+                result = {"error": f"Unexpected response from Drive: {str(e)}"}
+        errors.append(f"{name}: {result['error']}")
+    if created:
+        invalidate_cache()
+    
+    if params.response_format == ResponseFormat.JSON:
+        return msgspec.json.encode(
+            {"files": created, "count": len(created), "errors": errors}
+        ).decode()
+    
+    output = format_file_list(created)
+    if errors:
+        output += "\n**Errors**:\n" + "".join(f"- {error}\n" for error in errors)
+    return output
+
+
+# ============================================================
+# Tool: Upload File
+# ============================================================
+
+class UploadFileInput(_DriveInputBase):
+    """Input parameters for uploading a file."""
     name: str = Field(
         ...,
         description="File name with extension (e.g., 'event-plan.pdf')",
@@ -464,51 +1090,45 @@ async def google_drive_upload_file(params: UploadFileInput) -> str:
     if params.folder_id:
         metadata["parents"] = [params.folder_id]
     
-    # For simple file upload using multipart
+    # Metadata and content go up together in one multipart/related request
+    body, content_type = build_multipart_related(
+        metadata, params.content.encode(), params.mime_type
+    )
     token = get_access_token()
     headers = {
         "Authorization": f"Bearer {token}",
-    }
-    
-    # Create multipart upload
-    files = {
-        'metadata': (None, json.dumps(metadata), 'application/json'),
-        'file': (params.name, params.content.encode(), params.mime_type)
+        "Content-Type": content_type,
     }
     
     url = f"{GOOGLE_DRIVE_UPLOAD_BASE}/files"
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                url,
-                headers=headers,
-                files=files,
-                params={"uploadType": "multipart", "fields": "id, name, mimeType, webViewLink"}
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-            return format_file_info(result, params.response_format)
-            
-        except httpx.HTTPStatusError as e:
-            return f"Error: Upload failed with status {e.response.status_code}: {e.response.text}"
-        except Exception as e:
-            return f"Error: {str(e)}"
+    try:
+        response = await send_authorized(lambda: get_drive_client().post(
+            url,
+            headers=headers,
+            content=body,
+            params={"uploadType": "multipart", "fields": "id, name, mimeType, webViewLink"}
+        ), headers)
+        response.raise_for_status()
+        result = _parse_response(response)
+        
+        invalidate_cache()
+        if params.response_format == ResponseFormat.JSON:
+            return dumps_json(result)
+        return format_file_info(result)
+        
+    except httpx.HTTPStatusError as e:
+        return f"Error: Upload failed with status {e.response.status_code}: {e.response.text}"
+    except Exception as e:
+        return f"Error: {str(e)}"
 
 
 # ============================================================
 # Tool: Delete File
 # ============================================================
 
-class DeleteFileInput(BaseModel):
+class DeleteFileInput(_DriveInputBase):
     """Input parameters for deleting a file."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
-    
     file_id: str = Field(
         ...,
         description="Google Drive file ID to delete",
@@ -543,21 +1163,71 @@ async def google_drive_delete_file(params: DeleteFileInput) -> str:
     if "error" in result:
         return f"Error: {result['error']}"
     
+    invalidate_cache()
     return f"Successfully deleted file with ID: {params.file_id}"
 
 
 # ============================================================
-# Tool: Search Files
+# Tool: Delete Files (batch)
 # ============================================================
 
-class SearchFilesInput(BaseModel):
-    """Input parameters for searching files."""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
+class DeleteFilesInput(_DriveInputBase):
+    """Input parameters for deleting several files at once."""
+    file_ids: List[str] = Field(
+        ...,
+        description="Google Drive file IDs to delete",
+        min_length=1,
+        max_length=BATCH_MAX_REQUESTS
     )
+
+
+@mcp.tool(
+    name="google_drive_delete_files",
+    annotations={
+        "title": "Delete Files",
+        "readOnlyHint": False,
+        "destructiveHint": True,
+        "idempotentHint": False,
+        "openWorldHint": True
+    }
+)
+async def google_drive_delete_files(params: DeleteFilesInput) -> str:
+    """Delete several files from Google Drive with a single batch request.
     
+    Remove a set of outdated event documents at once. This operation is permanent.
+    
+    Args:
+        params (DeleteFilesInput): Parameters including:
+            - file_ids: IDs of files to delete
+    
+    Returns:
+        str: Confirmation message listing any files that could not be deleted
+    """
+    results = await make_drive_batch_request(
+        [("DELETE", f"files/{file_id}", None, None) for file_id in params.file_ids]
+    )
+    
+    errors = [
+        f"{file_id}: {result['error']}"
+        for file_id, result in zip(params.file_ids, results)
+        if "error" in result
+    ]
+    deleted = len(params.file_ids) - len(errors)
+    if deleted:
+        invalidate_cache()
+    
+    output = f"Successfully deleted {deleted} of {len(params.file_ids)} files"
+    if errors:
+        output += "\n**Errors**:\n" + "".join(f"- {error}\n" for error in errors)
+    return output
+
+
+# ============================================================
+# Tool: Search Files
+# ============================================================
+
+class SearchFilesInput(_DriveInputBase):
+    """Input parameters for searching files."""
     search_term: str = Field(
         ...,
         description="Search term to find in file names (e.g., 'conference', 'participant list')",
@@ -569,6 +1239,10 @@ class SearchFilesInput(BaseModel):
         ge=1,
         le=50
     )
+    include_trashed: bool = Field(
+        default=False,
+        description="Also return files in the trash"
+    )
     response_format: ResponseFormat = Field(
         default=ResponseFormat.MARKDOWN,
         description="Output format: 'markdown' or 'json'"
@@ -594,32 +1268,48 @@ async def google_drive_search_files(params: SearchFilesInput) -> str:
         params (SearchFilesInput): Parameters including:
             - search_term: Text to search for in file names
             - limit: Maximum results to return
+            - include_trashed: Also return trashed files
             - response_format: 'markdown' or 'json'
     
     Returns:
         str: List of matching files with details
     """
-    query = f"name contains '{params.search_term}' and trashed=false"
+    query = f"name contains '{drive_escape(params.search_term)}'"
+    if not params.include_trashed:
+        query += f" and {TRASHED_FILTER}"
     
-    result = await make_drive_request(
-        "GET",
-        "files",
-        params={
-            "q": query,
-            "pageSize": params.limit,
-            "fields": "files(id, name, mimeType, modifiedTime, webViewLink)"
-        }
-    )
+    if params.response_format == ResponseFormat.JSON:
+        fields = SEARCH_FILES_FIELDS
+    else:
+        fields = SEARCH_FILES_MARKDOWN_FIELDS
     
-    if "error" in result:
+    cache_key = ("search", query, fields, params.limit)
+    result = cache_get(cache_key)
+    if result is None:
+        generation = cache_generation()
+        result = await make_drive_request(
+            "GET",
+            "files",
+            params={
+                "q": query,
+                "pageSize": params.limit,
+                "fields": fields
+            },
+            decoder=FILE_LIST_DECODER
+        )
+        cache_put(cache_key, result, generation)
+    
+    if is_error(result):
         return f"Error: {result['error']}"
     
-    files = result.get("files", [])
+    files = result.files
     
     if not files:
         return f"No files found matching '{params.search_term}'"
     
-    return format_file_list(files, params.response_format, total=len(files))
+    if params.response_format == ResponseFormat.JSON:
+        return dumps_file_list(files, total=len(files))
+    return format_file_list(files, total=len(files))
 
 
 # ============================================================
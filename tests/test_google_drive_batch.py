@@ -0,0 +1,135 @@
+"""
+Tests for the Drive batch request encoder and response parser
+"""
+
+import unittest
+from email.parser import BytesParser
+
+from google_drive_mcp import build_batch_body, parse_batch_response
+
+
+# Shaped like a real Drive batch response: unquoted boundary containing "=",
+# parts in a different order from the request, and per-part HTTP headers
+RECORDED_CONTENT_TYPE = "multipart/mixed; boundary=batch_pK7JBAk73-E=_AA5eFwv4m2Q="
+RECORDED_RESPONSE = (
+    b"--batch_pK7JBAk73-E=_AA5eFwv4m2Q=\r\n"
+    b"Content-Type: application/http\r\n"
+    b"Content-ID: <response-item1>\r\n"
+    b"\r\n"
+    b"HTTP/1.1 404 Not Found\r\n"
+    b"Content-Type: application/json; charset=UTF-8\r\n"
+    b"Date: Tue, 22 Jan 2019 18:56:00 GMT\r\n"
+    b"Expires: Mon, 01 Jan 1990 00:00:00 GMT\r\n"
+    b"Cache-Control: no-cache, no-store, max-age=0, must-revalidate\r\n"
+    b"Vary: Origin, X-Origin\r\n"
+    b"\r\n"
+    b"{\r\n"
+    b' "error": {\r\n'
+    b'  "code": 404,\r\n'
+    b'  "message": "File not found: missing."\r\n'
+    b" }\r\n"
+    b"}\r\n"
+    b"\r\n"
+    b"--batch_pK7JBAk73-E=_AA5eFwv4m2Q=\r\n"
+    b"Content-Type: application/http\r\n"
+    b"Content-ID: <response-item0>\r\n"
+    b"\r\n"
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json; charset=UTF-8\r\n"
+    b"Date: Tue, 22 Jan 2019 18:56:00 GMT\r\n"
+    b"Expires: Tue, 22 Jan 2019 18:56:00 GMT\r\n"
+    b"Cache-Control: private, max-age=0\r\n"
+    b"Content-Length: 109\r\n"
+    b"\r\n"
+    b"{\r\n"
+    b' "id": "1a2b3c",\r\n'
+    b' "name": "Venue Contracts",\r\n'
+    b' "webViewLink": "https://drive.google.com/drive/folders/1a2b3c"\r\n'
+    b"}\r\n"
+    b"\r\n"
+    b"--batch_pK7JBAk73-E=_AA5eFwv4m2Q=\r\n"
+    b"Content-Type: application/http\r\n"
+    b"Content-ID: <response-item2>\r\n"
+    b"\r\n"
+    b"HTTP/1.1 204 No Content\r\n"
+    b"Date: Tue, 22 Jan 2019 18:56:00 GMT\r\n"
+    b"\r\n"
+    b"\r\n"
+    b"--batch_pK7JBAk73-E=_AA5eFwv4m2Q=--\r\n"
+)
+
+
+def _part(content_id: bytes, http_response: bytes) -> bytes:
+    return (
+        b"--b\r\nContent-Type: application/http\r\nContent-ID: " + content_id
+        + b"\r\n\r\n" + http_response + b"\r\n"
+    )
+
+
+class ParseBatchResponseTest(unittest.TestCase):
+    def test_recorded_response(self):
+        results = parse_batch_response(RECORDED_CONTENT_TYPE, RECORDED_RESPONSE, 3)
+        self.assertEqual(results[0], (200, {
+            "id": "1a2b3c",
+            "name": "Venue Contracts",
+            "webViewLink": "https://drive.google.com/drive/folders/1a2b3c",
+        }))
+        self.assertEqual(results[1][0], 404)
+        self.assertIn("not found", results[1][1]["error"])
+        self.assertEqual(results[2], (204, {"success": True}))
+
+    def test_missing_part_is_an_error_for_that_call(self):
+        results = parse_batch_response(RECORDED_CONTENT_TYPE, RECORDED_RESPONSE, 4)
+        self.assertEqual(results[3][0], 0)
+        self.assertIn("error", results[3][1])
+        self.assertNotIn("error", results[0][1])
+
+    def test_unparseable_parts_do_not_raise(self):
+        content = (
+            _part(b"<response-item0>", b"HTTP/1.1 200 OK\r\n\r\nnot json")
+            + _part(b"<response-item1>", b"garbage")
+            + _part(b"<response-item2>", b'HTTP/1.1 200 OK\r\n\r\n{"id": "ok"}')
+            + b"--b--\r\n"
+        )
+        results = parse_batch_response("multipart/mixed; boundary=b", content, 3)
+        self.assertIn("error", results[0][1])
+        self.assertIn("error", results[1][1])
+        self.assertEqual(results[2], (200, {"id": "ok"}))
+
+    def test_non_multipart_response(self):
+        results = parse_batch_response("", b"<html>Bad Gateway</html>", 2)
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all("error" in result for _, result in results))
+
+    def test_throttled_part_keeps_its_status(self):
+        content = (
+            _part(b"<response-item0>", b"HTTP/1.1 429 Too Many Requests\r\n\r\n{}")
+            + b"--b--\r\n"
+        )
+        results = parse_batch_response("multipart/mixed; boundary=b", content, 1)
+        self.assertEqual(results[0][0], 429)
+
+
+class BuildBatchBodyTest(unittest.TestCase):
+    def test_round_trips_through_a_mime_parser(self):
+        calls = [
+            ("POST", "files", {"fields": "id, name"}, {"name": "Catering"}),
+            ("DELETE", "files/abc", None, None),
+        ]
+        body = build_batch_body(calls, "batch_test")
+        envelope = BytesParser().parsebytes(
+            b"Content-Type: multipart/mixed; boundary=batch_test\r\n\r\n" + body
+        )
+        parts = envelope.get_payload()
+        self.assertEqual([part["Content-ID"] for part in parts], ["<item0>", "<item1>"])
+
+        post = parts[0].get_payload(decode=True)
+        self.assertTrue(post.startswith(b"POST /drive/v3/files?fields=id%2C+name HTTP/1.1\r\n"))
+        self.assertTrue(post.rstrip().endswith(b'{"name":"Catering"}'))
+
+        delete = parts[1].get_payload(decode=True)
+        self.assertTrue(delete.startswith(b"DELETE /drive/v3/files/abc HTTP/1.1\r\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Tests for the Drive response cache, request coalescing, page prefetch and
+retry timing
+"""
+
+import asyncio
+import os
+import unittest
+
+import httpx
+from aiolimiter import AsyncLimiter
+
+os.environ.setdefault("GOOGLE_DRIVE_ACCESS_TOKEN", "test-token")
+
+import google_drive_mcp as drive
+from google_drive_mcp import (
+    BACKOFF_BASE,
+    CreateFolderInput,
+    ListFilesInput,
+    google_drive_create_folder,
+    google_drive_list_files,
+    retry_delay,
+)
+
+
+class FakeDrive:
+    """Mock Drive API that records requests and can hold GETs until released"""
+
+    def __init__(self, hold_gets: bool = False):
+        self.requests = []
+        self.release = asyncio.Event()
+        if not hold_gets:
+            self.release.set()
+        self.get_arrived = asyncio.Event()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": "folder1", "name": "New Folder"})
+        self.get_arrived.set()
+        await self.release.wait()
+        body = {"files": [{"id": f"file{len(self.requests)}", "name": "Agenda"}]}
+        if "pageToken" not in request.url.params:
+            body["nextPageToken"] = "page2"
+        return httpx.Response(200, json=body)
+
+    def gets(self):
+        return [request for request in self.requests if request.method == "GET"]
+
+
+class DriveTestCase(unittest.IsolatedAsyncioTestCase):
+    def install(self, fake: FakeDrive) -> None:
+        drive._DRIVE_CLIENT = httpx.AsyncClient(transport=httpx.MockTransport(fake))
+
+    async def asyncSetUp(self):
+        # Module-level state is shared between tests; loop-bound primitives
+        # are recreated on each test's event loop
+        drive._LIST_CACHE.clear()
+        drive._INFLIGHT.clear()
+        drive._PREFETCH_PENDING.clear()
+        drive._PREFETCH_TASKS.clear()
+        drive._PREFETCH_SLOTS = asyncio.Semaphore(2)
+        drive._RATE = AsyncLimiter(max_rate=8, time_period=1.0)
+        drive._ACCESS_TOKEN = None
+
+    async def asyncTearDown(self):
+        if drive._PREFETCH_TASKS:
+            await asyncio.gather(*drive._PREFETCH_TASKS)
+        if drive._DRIVE_CLIENT is not None:
+            await drive._DRIVE_CLIENT.aclose()
+            drive._DRIVE_CLIENT = None
+
+
+class CacheInvalidationTest(DriveTestCase):
+    async def test_write_during_read_does_not_recache_stale_listing(self):
+        fake = FakeDrive(hold_gets=True)
+        self.install(fake)
+
+        read = asyncio.create_task(google_drive_list_files(ListFilesInput()))
+        await fake.get_arrived.wait()
+        await google_drive_create_folder(CreateFolderInput(name="New Folder"))
+        fake.release.set()
+        await read
+
+        self.assertEqual(len(drive._LIST_CACHE), 0)
+
+    async def test_read_after_write_does_not_join_earlier_request(self):
+        fake = FakeDrive(hold_gets=True)
+        self.install(fake)
+
+        before = asyncio.create_task(google_drive_list_files(ListFilesInput()))
+        await fake.get_arrived.wait()
+        await google_drive_create_folder(CreateFolderInput(name="New Folder"))
+        after = asyncio.create_task(google_drive_list_files(ListFilesInput()))
+        await asyncio.sleep(0.01)
+        fake.release.set()
+        await asyncio.gather(before, after)
+
+        self.assertEqual(len(fake.gets()), 2)
+        # Only the post-write response is cached
+        self.assertEqual(len(drive._LIST_CACHE), 1)
+
+
+class CoalescingTest(DriveTestCase):
+    async def test_concurrent_full_pages_make_one_request_and_one_prefetch(self):
+        fake = FakeDrive()
+        self.install(fake)
+
+        await asyncio.gather(*[
+            google_drive_list_files(ListFilesInput(limit=100)) for _ in range(3)
+        ])
+        self.assertEqual(len(drive._PREFETCH_TASKS), 1)
+        await asyncio.gather(*drive._PREFETCH_TASKS)
+
+        page_tokens = [request.url.params.get("pageToken") for request in fake.gets()]
+        self.assertEqual(page_tokens, [None, "page2"])
+
+        # The caller's next call is served from the prefetched page
+        await google_drive_list_files(ListFilesInput(limit=100, page_token="page2"))
+        self.assertEqual(len(fake.gets()), 2)
+
+
+class RetryDelayTest(unittest.TestCase):
+    def delay(self, retry_after: str, attempt: int = 0):
+        return retry_delay(httpx.Response(429, headers={"Retry-After": retry_after}), attempt)
+
+    def test_short_retry_after_is_honoured(self):
+        self.assertEqual(self.delay("2"), 2.0)
+
+    def test_long_retry_after_gives_up(self):
+        self.assertIsNone(self.delay("3600"))
+
+    def test_non_finite_retry_after_gives_up(self):
+        self.assertIsNone(self.delay("inf"))
+        self.assertIsNone(self.delay("nan"))
+
+    def test_http_date_falls_back_to_backoff(self):
+        delay = self.delay("Wed, 21 Oct 2026 07:28:00 GMT")
+        self.assertGreaterEqual(delay, BACKOFF_BASE / 2)
+        self.assertLessEqual(delay, BACKOFF_BASE)
+
+
+if __name__ == "__main__":
+    unittest.main()